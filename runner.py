@@ -8,14 +8,57 @@ Orchestrates experiments by alternating between:
 """
 
 import argparse
+import atexit
+import functools
+import gzip
 import json
 import os
+import shutil
+import signal
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize JSON with 2-space indent, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_gpu() -> Tuple[str, str, bool]:
+    """Describe the available GPU once per process; returns (info, log message, ok)"""
+    try:
+        import torch
+    except ImportError:
+        return "PyTorch not installed", "PyTorch not installed - install dependencies first", False
+    
+    try:
+        if torch.cuda.is_available():
+            gpu_mem = torch.cuda.get_device_properties(0).total_memory / 1e9
+            gpu_name = torch.cuda.get_device_name(0)
+            return f"GPU: {gpu_name} ({gpu_mem:.1f}GB)", f"GPU available: {gpu_name} ({gpu_mem:.1f}GB)", True
+        return "No GPU available - using CPU", "No GPU available - will use CPU", True
+    except Exception as e:
+        return f"Resource check failed: {e}", f"Resource check failed: {e}", False
+
 
 class ExperimentRunner:
     def __init__(self, experiment_dir: str, max_iterations: int = 10, allow_uv: bool = False, allow_pip: bool = False):
@@ -25,6 +68,13 @@ class ExperimentRunner:
         self.allow_pip = allow_pip
         self.iteration = 0
         
+        # Command prefix shared by every Claude call, with JSON output
+        self._base_cmd = [
+            "claude", 
+            "--output-format", "json",
+            "--allowedTools", self._build_allowed_tools()
+        ]
+        
         # Key files
         self.idea_file = self.experiment_dir / "IDEA.md"
         self.plan_file = self.experiment_dir / "PLAN.md"
@@ -35,7 +85,16 @@ class ExperimentRunner:
         self.logs_dir = self.experiment_dir / "logs"
         self.logs_dir.mkdir(exist_ok=True)
         
+        # Keep one buffered handle for runner.log instead of reopening per line
+        self._log_fh = open(self.logs_dir / "runner.log", 'a', buffering=1 << 16)
+        atexit.register(self._log_fh.close)
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+        
         self._validate_setup()
+        self._status = self._load_status()
+        # Kept across resumes so the watchdog can measure total runtime
+        self._status.setdefault("start_time", time.time())
         self.session_id = self.get_session_id()
     
     def _validate_setup(self):
@@ -47,69 +106,100 @@ class ExperimentRunner:
     
     def log(self, message: str):
         """Simple logging with timestamp"""
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        # Re-format the timestamp only when the second changes
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._last_ts_sec = now
+        timestamp = self._last_ts_str
         print(f"[{timestamp}] {message}")
         
-        # Also save to file
-        log_file = self.logs_dir / "runner.log"
-        with open(log_file, 'a') as f:
-            f.write(f"[{timestamp}] {message}\n")
+        # Also save to file (flushed in save_status and before long waits)
+        self._log_fh.write(f"[{timestamp}] {message}\n")
+    
+    def _load_status(self) -> Dict:
+        """Load status.json once at startup"""
+        try:
+            return _json_loads(self.status_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            # Don't silently restart from iteration 1 over existing logs
+            print(f"ERROR: Could not read {self.status_file}: {e}")
+            print("Fix or remove status.json to continue")
+            sys.exit(1)
     
     def save_status(self):
         """Save current status"""        
+        # Keep runner.log consistent with status.json on disk
+        self._log_fh.flush()
+        
         # Update status while preserving session_id
-        status = {
+        new = {
             "iteration": self.iteration,
-            "timestamp": time.time(),
             "complete": self.report_file.exists(),
             "session_id": self.session_id
         }
         
-        with open(self.status_file, 'w') as f:
-            json.dump(status, f, indent=2)
+        # Skip the write when nothing but the timestamp would change
+        if self.status_file.exists() and all(self._status.get(k) == v for k, v in new.items()):
+            return
+        
+        self._status.update(new, timestamp=time.time())
+        
+        # Write to a temp file and swap it in so readers never see a partial file
+        tmp = self.status_file.with_suffix(".json.tmp")
+        tmp.write_bytes(_json_dumps(self._status))
+        os.replace(tmp, self.status_file)
     
-    def run_claude(self, prompt: str, retry_count: int = 0) -> bool:
-        """Run Claude Code CLI command with retry logic"""
-        # Build command with JSON output
-        allowed_tools = "Edit,Write,WebFetch,Bash(ls:*)"
+    def _build_allowed_tools(self) -> str:
+        """Tools Claude may use without prompting"""
+        # zcat lets Claude read older iterations' gzipped training logs
+        allowed_tools = "Edit,Write,WebFetch,Bash(ls:*),Bash(zcat:*)"
         if self.allow_uv:
             allowed_tools += ",Bash(uv:*)"
         if self.allow_pip:
             allowed_tools += ",Bash(pip:*)"
+        return allowed_tools
+    
+    def _claude_cmd(self, prompt: str) -> list:
+        """Build the Claude CLI argv for one print-mode call"""
+        cmd = list(self._base_cmd)
         
-        cmd = [
-            "claude", 
-            "--output-format", "json",
-            "--allowedTools", allowed_tools
-        ]
-        
-        # Add resume flag if we have a session ID
+        # Add resume flag if we have a session ID; this is how conversation
+        # state carries over, since print mode has no long-lived process
         if self.session_id:
             cmd.extend(["--resume", self.session_id])
             self.log(f"Resuming session: {self.session_id}")
 
         cmd.extend(["-p", prompt])
+        return cmd
+    
+    def run_claude(self, prompt: str, retry_count: int = 0) -> bool:
+        """Run Claude Code CLI command with retry logic"""
+        cmd = self._claude_cmd(prompt)
         
         self.log(f"Iteration {self.iteration}: Running Claude analysis...")
 
         # print(cmd)
 
+        # Raw JSON envelope is written here as it arrives
+        json_file = self.logs_dir / f"claude_response_{self.iteration}.json"
+
+        self._log_fh.flush()
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.experiment_dir,
-                capture_output=True,
-                text=True,
+            returncode, stdout, stderr = self._stream_claude(
+                cmd, json_file,
                 timeout=600  # 10 minute timeout
             )
             
-            if result.returncode == 0:
+            if returncode == 0:
                 # Parse JSON output
                 try:
-                    output_data = json.loads(result.stdout)
+                    output_data = _json_loads(stdout)
                     
-                    # Extract session ID from first call
-                    if "session_id" in output_data:
+                    # Extract session ID from first call; later calls resume the same one
+                    if "session_id" in output_data and output_data["session_id"] != self.session_id:
                         self.session_id = output_data["session_id"]
                         self.save_status()
                         self.log(f"Session ID saved: {self.session_id}")
@@ -122,12 +212,11 @@ class ExperimentRunner:
                     
                 except json.JSONDecodeError as e:
                     self.log(f"Failed to parse Claude JSON output: {e}")
-                    # Save raw output for debugging
-                    debug_file = self.logs_dir / f"claude_raw_output_{self.iteration}.txt"
-                    debug_file.write_text(result.stdout)
+                    self._keep_raw_claude_output(json_file)
                     return False
             else:
-                error_msg = result.stderr[:200] if result.stderr else "Unknown error"
+                self._keep_raw_claude_output(json_file)
+                error_msg = stderr[:200].decode(errors="replace") if stderr else "Unknown error"
                 self.log(f"Claude error: {error_msg}...")
                 
                 # Retry logic for transient failures
@@ -140,38 +229,76 @@ class ExperimentRunner:
                 
         except subprocess.TimeoutExpired:
             self.log("Claude command timed out")
+            self._keep_raw_claude_output(json_file)
             # Save prompt for manual inspection
             timeout_file = self.logs_dir / f"timeout_prompt_{self.iteration}.txt"
-            timeout_file.write_text(prompt)
+            timeout_file.write_bytes(prompt.encode("utf-8"))
             return False
         except Exception as e:
             self.log(f"Claude error: {str(e)}")
             return False
     
-    def get_session_id(self) -> Optional[str]:
-        """Get stored session ID from status.json"""
-        if self.status_file.exists():
-            try:
-                with open(self.status_file) as f:
-                    status = json.load(f)
-                    return status.get("session_id")
-            except:
-                pass
-        return None
+    def _keep_raw_claude_output(self, json_file: Path):
+        """Move unparseable or partial Claude output aside for debugging"""
+        # Save raw output for debugging; drop the file if nothing was written
+        try:
+            if json_file.stat().st_size:
+                os.replace(json_file, self.logs_dir / f"claude_raw_output_{self.iteration}.txt")
+            else:
+                json_file.unlink()
+        except FileNotFoundError:
+            pass
     
-    def save_session_id(self, session_id: str):
-        """Save session ID to status.json"""
-        status = {}
-        if self.status_file.exists():
+    def _stream_claude(self, cmd: list, out_file: Path, timeout: float) -> Tuple[int, bytearray, bytearray]:
+        """Run Claude, copying stdout to out_file in chunks as it is produced"""
+        stdout = bytearray()
+        stderr = bytearray()
+        timed_out = threading.Event()
+        
+        # Own session so the whole tree (Claude's tool subprocesses included)
+        # can be killed; otherwise descendants holding the pipes outlive the timeout
+        with subprocess.Popen(
+            cmd,
+            cwd=self.experiment_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True
+        ) as proc:
+            def kill_group():
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            
+            def kill_on_timeout():
+                timed_out.set()
+                kill_group()
+            
+            # Drain stderr separately so a full pipe can't stall the child
+            stderr_reader = threading.Thread(target=lambda: stderr.extend(proc.stderr.read()), daemon=True)
+            stderr_reader.start()
+            timer = threading.Timer(timeout, kill_on_timeout)
+            timer.start()
             try:
-                with open(self.status_file) as f:
-                    status = json.load(f)
-            except:
-                pass
-        
-        status["session_id"] = session_id
-        with open(self.status_file, 'w') as f:
-            json.dump(status, f, indent=2)
+                with open(out_file, 'wb') as f:
+                    for chunk in iter(lambda: proc.stdout.read(1 << 16), b""):
+                        f.write(chunk)
+                        stdout.extend(chunk)
+                returncode = proc.wait()
+                stderr_reader.join()
+            except BaseException:
+                kill_group()
+                raise
+            finally:
+                timer.cancel()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return returncode, stdout, stderr
+    
+    def get_session_id(self) -> Optional[str]:
+        """Get stored session ID from status.json"""
+        return self._status.get("session_id")
     
     def _log_claude_output(self, output_data: dict):
         """Log formatted output from Claude JSON response"""
@@ -179,11 +306,6 @@ class ExperimentRunner:
         if "result" in output_data:
             content = output_data["result"]
             self.log(f"Claude response:\n{content}")
-        
-        # Save full JSON for debugging
-        json_file = self.logs_dir / f"claude_response_{self.iteration}.json"
-        with open(json_file, 'w') as f:
-            json.dump(output_data, f, indent=2)
     
     def run_training(self) -> Tuple[bool, str]:
         """Run the main training script"""
@@ -205,15 +327,22 @@ class ExperimentRunner:
         stdout_file = self.logs_dir / f"iter_{self.iteration}_stdout.txt"
         stderr_file = self.logs_dir / f"iter_{self.iteration}_stderr.txt"
         
+        # Make "Running ..." visible in runner.log for the length of the run
+        self._log_fh.flush()
+        
+        # Raw OS-level fds so the child writes straight to disk
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        fd_out = fd_err = None
         try:
-            with open(stdout_file, 'w') as out, open(stderr_file, 'w') as err:
-                result = subprocess.run(
-                    [sys.executable, script_path],
-                    cwd=self.experiment_dir,
-                    stdout=out,
-                    stderr=err,
-                    timeout=7200  # 2 hour timeout
-                )
+            fd_out = os.open(str(stdout_file), flags, 0o644)
+            fd_err = os.open(str(stderr_file), flags, 0o644)
+            result = subprocess.run(
+                [sys.executable, script_path],
+                cwd=self.experiment_dir,
+                stdout=fd_out,
+                stderr=fd_err,
+                timeout=7200  # 2 hour timeout
+            )
             
             if result.returncode == 0:
                 self.log(f"Training completed successfully")
@@ -228,6 +357,27 @@ class ExperimentRunner:
         except Exception as e:
             self.log(f"Training error: {str(e)}")
             return False, str(e)
+        finally:
+            for fd in (fd_out, fd_err):
+                if fd is not None:
+                    os.close(fd)
+    
+    def _compress_training_logs(self, iteration: int):
+        """Gzip an iteration's stdout/stderr logs and remove the originals"""
+        for stream in ("stdout", "stderr"):
+            log_file = self.logs_dir / f"iter_{iteration}_{stream}.txt"
+            if not log_file.exists():
+                continue
+            gz_file = log_file.with_name(log_file.name + ".gz")
+            try:
+                # Level 1: most of the size win at a fraction of level 9's time
+                with open(log_file, 'rb') as src, gzip.open(gz_file, 'wb', compresslevel=1) as dst:
+                    shutil.copyfileobj(src, dst, 1 << 16)
+                log_file.unlink()
+            except OSError as e:
+                self.log(f"Failed to compress {log_file.name}: {e}")
+                # Keep the intact .txt; never leave a truncated .gz beside it
+                gz_file.unlink(missing_ok=True)
     
     def create_initial_plan(self):
         """Create initial experiment plan"""
@@ -258,24 +408,12 @@ System Information:
     
     def _check_resources(self):
         """Check available system resources"""
-        self.gpu_info = None
-        try:
-            import torch
-            if torch.cuda.is_available():
-                gpu_mem = torch.cuda.get_device_properties(0).total_memory / 1e9
-                gpu_name = torch.cuda.get_device_name(0)
-                self.gpu_info = f"GPU: {gpu_name} ({gpu_mem:.1f}GB)"
-                self.log(f"GPU available: {gpu_name} ({gpu_mem:.1f}GB)")
-            else:
-                self.gpu_info = "No GPU available - using CPU"
-                self.log("No GPU available - will use CPU")
-        except ImportError:
-            self.gpu_info = "PyTorch not installed"
-            self.log("PyTorch not installed - install dependencies first")
-            sys.exit(1)
-        except Exception as e:
-            self.gpu_info = f"Resource check failed: {e}"
-            self.log(f"Resource check failed: {e}")
+        if hasattr(self, 'gpu_info'):
+            return
+        
+        self.gpu_info, message, ok = _probe_gpu()
+        self.log(message)
+        if not ok:
             sys.exit(1)
     
     def run_iteration(self):
@@ -295,8 +433,7 @@ System Information:
         # Step 2: Analyze with Claude
         if self.iteration == 1:
             # Check resources if not already done
-            if not hasattr(self, 'gpu_info'):
-                self._check_resources()
+            self._check_resources()
             
             prompt = f"""This is iteration {self.iteration} of the ML experiment.
 
@@ -336,6 +473,9 @@ Examine the latest logs and results, then:
         if not claude_success:
             self.log("Claude analysis failed - will retry next iteration")
         
+        # Claude has seen this and the previous iteration's logs; older ones can shrink
+        self._compress_training_logs(self.iteration - 1)
+        
         self.save_status()
         return True  # Continue iterating
     
@@ -344,13 +484,10 @@ Examine the latest logs and results, then:
         self.log(f"Starting automated experiment in {self.experiment_dir}")
         
         # Load previous iteration if resuming
-        if self.status_file.exists():
-            with open(self.status_file) as f:
-                status = json.load(f)
-                self.iteration = status.get("iteration", 0)
-                if status.get("complete", False):
-                    self.log("Experiment already complete")
-                    return
+        self.iteration = self._status.get("iteration", 0)
+        if self._status.get("complete", False):
+            self.log("Experiment already complete")
+            return
         
         # Create initial plan
         if not self.plan_file.exists():
@@ -358,14 +495,12 @@ Examine the latest logs and results, then:
             if not self.create_initial_plan():
                 self.log("Failed to create plan - exiting")
                 return
-            time.sleep(2)  # Brief pause
         
         # Main experiment loop
         try:
             while self.iteration < self.max_iterations:
                 if not self.run_iteration():
                     break
-                time.sleep(3)  # Brief pause between iterations
                 
         except KeyboardInterrupt:
             self.log("\nExperiment interrupted by user")
@@ -417,17 +552,32 @@ Example usage:
     
     args = parser.parse_args()
     
-    # Verify Claude is available
-    try:
-        subprocess.run(
-            ["claude", "--version"],
-            capture_output=True,
-            check=True
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("ERROR: Claude Code CLI not found")
-        print("Please install: https://github.com/anthropics/claude-code")
-        sys.exit(1)
+    # Verify Claude is available (a successful check is cached for a day)
+    claude_ok = Path.home() / ".cache" / "claude-torch-runner" / "claude_ok"
+    if not (claude_ok.exists() and time.time() - claude_ok.stat().st_mtime < 86400):
+        # An absolute path lets subprocess use posix_spawn; a bare name forces fork/exec
+        claude_bin = shutil.which("claude")
+        try:
+            if claude_bin is None:
+                raise FileNotFoundError("claude")
+            # No runner fds are open yet (and Python's are non-inheritable anyway),
+            # so the close_fds sweep can be skipped
+            subprocess.run(
+                [claude_bin, "--version"],
+                capture_output=True,
+                check=True,
+                close_fds=False
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            print("ERROR: Claude Code CLI not found")
+            print("Please install: https://github.com/anthropics/claude-code")
+            sys.exit(1)
+        
+        try:
+            claude_ok.parent.mkdir(parents=True, exist_ok=True)
+            claude_ok.touch()
+        except OSError:
+            pass
     
     # Run experiment
     runner = ExperimentRunner(
@@ -16,11 +16,16 @@ def check_experiment(exp_dir: Path, max_hours: float = 24):
     if not status_file.exists():
         return False, "No status file"
     
+    # Check if stuck (no progress in 2 hours) - file mtime is enough, no parse needed
+    hours_since_update = (time.time() - status_file.stat().st_mtime) / 3600
+    if hours_since_update > 2:
+        return True, f"No progress for {hours_since_update:.1f} hours"
+    
     with open(status_file) as f:
         status = json.load(f)
     
-    # Check runtime
-    start_time = status.get("timestamp", time.time())
+    # Check runtime since the runner first started this experiment
+    start_time = status.get("start_time", time.time())
     hours_elapsed = (time.time() - start_time) / 3600
     
     if hours_elapsed > max_hours:
@@ -31,12 +36,6 @@ def check_experiment(exp_dir: Path, max_hours: float = 24):
     if iteration > 20:
         return True, f"Exceeded 20 iterations"
     
-    # Check if stuck (no progress in 2 hours)
-    last_update = status.get("timestamp", time.time())
-    hours_since_update = (time.time() - last_update) / 3600
-    if hours_since_update > 2:
-        return True, f"No progress for {hours_since_update:.1f} hours"
-    
     return False, f"Iteration {iteration}, {hours_elapsed:.1f} hours"
 
 if __name__ == "__main__":